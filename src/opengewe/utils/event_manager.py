@@ -37,6 +37,18 @@ class EventManager:
                 # 按优先级排序，优先级高的在前（数字小的优先级高）
                 cls._handlers[message_type].sort(key=lambda x: x[2])
 
+    @classmethod
+    def has_handlers(cls, message_type: MessageType) -> bool:
+        """检查指定消息类型是否有已注册的处理函数
+
+        Args:
+            message_type: 消息类型
+
+        Returns:
+            bool: 存在处理函数时返回True
+        """
+        return message_type in cls._handlers
+
     @classmethod
     async def emit(cls, message_type: MessageType, *args, **kwargs) -> None:
         """触发指定类型的事件
@@ -54,6 +54,10 @@ class PluginBase(ABC):
     author: str = "未知"
     version: str = "1.0.0"
 
+    # 设为True时，on_enable和async_init会并发执行（加快I/O密集型初始化）
+    # 仅当async_init不依赖on_enable的执行结果时才应开启
+    parallel_init: bool = False
+
     def __init__(self):
         """初始化插件实例"""
         self.enabled: bool = False
@@ -5,12 +5,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import importlib
-import inspect
+import json
 import os
 import sys
 import tomllib
-import traceback
 from typing import Dict, List, Type, Union, Tuple, Optional, Any, TYPE_CHECKING
 
 from opengewe.utils.singleton import Singleton
@@ -25,6 +27,136 @@ if TYPE_CHECKING:
 # 获取插件管理器日志记录器
 logger = get_logger("PluginManager")
 
+# 已解析的主配置缓存，键为(路径, mtime_ns, 大小)
+# 单例被重置（测试/热重载）时避免重复解析TOML
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# 插件模块的固定顶层包名，预先物化前缀及其长度，
+# 热路径上的前缀判断和目录提取不再重建字面量
+_PLUGIN_PREFIX = "plugins."
+_PLUGIN_PREFIX_LEN = len(_PLUGIN_PREFIX)
+
+# 已插入sys.path的目录集合，用O(1)成员检查代替线性扫描sys.path；
+# 放在模块级使单例重置后依然有效（插入的路径从不会被移除）
+_inserted_paths: set[str] = set()
+
+# 插件模块最近一次加载时main.py的mtime，用于跳过不必要的reload；
+# 与sys.modules一样是进程级状态，放在模块级保证单例重置后
+# 仍能识别缓存模块对应的源文件是否已变化
+_module_mtimes: Dict[str, int] = {}
+
+
+def _cached_import(module_name: str):
+    """导入模块，优先走sys.modules快速路径
+
+    对已完成初始化的模块直接返回sys.modules中的缓存对象，
+    跳过importlib.import_module的查找与加载开销；
+    未导入或仍在初始化中的模块走正常导入流程。
+
+    Args:
+        module_name: 完整模块名
+
+    Returns:
+        导入的模块对象
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        spec = getattr(module, "__spec__", None)
+        if spec is not None and not getattr(spec, "_initializing", False):
+            return module
+    return importlib.import_module(module_name)
+
+
+@functools.lru_cache(maxsize=512)
+def _module_to_directory(module_name: str) -> str:
+    """从插件模块名推导插件目录名
+
+    同一模块会在多次加载/重载中反复出现，结果按模块名缓存，
+    避免每次加载都做split产生临时列表。
+
+    Args:
+        module_name: 插件类所在模块的完整名称
+
+    Returns:
+        str: 插件目录名，非常规模块路径返回"unknown"
+    """
+    if module_name.startswith(_PLUGIN_PREFIX):
+        # partition在C层完成切分，不产生中间列表
+        return module_name[_PLUGIN_PREFIX_LEN:].partition(".")[0]
+    logger.warning(f"非常规插件模块路径: {module_name}")
+    return "unknown"
+
+
+def _iter_plugin_classes(module):
+    """遍历模块中定义的插件类
+
+    直接扫描vars(module)，跳过inspect.getmembers的排序和
+    逐属性getattr开销；同时通过__module__过滤掉从其他模块
+    导入的PluginBase子类，避免把re-export的类重复注册。
+
+    Args:
+        module: 已导入的插件模块
+
+    Yields:
+        Type[PluginBase]: 在该模块中定义的插件类
+    """
+    # 将循环内反复引用的名称绑定为局部变量，消除每次迭代的LOAD_GLOBAL
+    module_name = module.__name__
+    base = PluginBase
+    is_type = isinstance
+    is_sub = issubclass
+    for obj in vars(module).values():
+        if not is_type(obj, type):
+            continue
+        if obj is base or not is_sub(obj, base):
+            continue
+        if obj.__module__ != module_name:
+            continue
+        yield obj
+
+
+def _load_main_config(path: str = "main_config.toml") -> Dict[str, Any]:
+    """读取并解析主配置文件，按(路径, mtime, 大小)缓存解析结果
+
+    Args:
+        path: 配置文件路径
+
+    Returns:
+        Dict[str, Any]: 解析后的配置字典
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        # 一次性读入内存再解析，避免多次小块读取
+        with open(path, "rb") as f:
+            data = f.read()
+
+        # 优先尝试预编译的JSON缓存（首行为内容校验和），
+        # 冷启动时json.load远快于tomllib解析
+        sha = hashlib.blake2b(data, digest_size=16).hexdigest()
+        cache_path = os.path.splitext(path)[0] + ".cache.json"
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                if f.readline().strip() == sha:
+                    config = json.load(f)
+        except (OSError, ValueError):
+            config = None
+
+        if config is None:
+            config = tomllib.loads(data.decode("utf-8"))
+            # 写入缓存失败（只读文件系统、不可序列化的值等）不影响正常流程
+            try:
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    f.write(sha + "\n")
+                    json.dump(config, f, ensure_ascii=False)
+            except (OSError, TypeError, ValueError):
+                pass
+
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[key] = config
+    return config
+
 
 class PluginManager(metaclass=Singleton):
     """插件管理器
@@ -41,23 +173,36 @@ class PluginManager(metaclass=Singleton):
         self.plugin_classes: Dict[str, Type[PluginBase]] = {}
         # 插件信息
         self.plugin_info: Dict[str, Dict[str, Any]] = {}
+        # 全量插件信息的物化缓存，加载/卸载时失效
+        self._plugin_info_cache: Optional[Tuple[Dict[str, Any], ...]] = None
 
         # 客户端实例
         self.client = None
 
+        # 保护plugins/plugin_info并发写入的锁（并发加载插件时使用）
+        self._state_lock = asyncio.Lock()
+        # 正在加载中的插件名，防止并发加载同名插件时重复通过检查
+        self._loading: set[str] = set()
+
+        # 插件类名到模块名的索引，使按名称加载无需扫描全部插件目录
+        self._name_to_module: Dict[str, str] = {}
+
+        # 插件搜索路径是否已设置完成，避免每次加载都重复检查
+        self._paths_ready = False
+
         # 读取配置文件中的禁用插件列表
         try:
-            with open("main_config.toml", "rb") as f:
-                main_config = tomllib.load(f)
-                self.excluded_plugins = main_config.get("opengewe", {}).get(
-                    "disabled-plugins", []
-                )
+            main_config = _load_main_config()
+            # 使用frozenset保证O(1)的禁用插件成员检查
+            self.excluded_plugins = frozenset(
+                main_config.get("opengewe", {}).get("disabled-plugins", [])
+            )
         except FileNotFoundError:
             logger.warning("未找到配置文件 main_config.toml，使用空的禁用插件列表")
-            self.excluded_plugins = []
+            self.excluded_plugins = frozenset()
         except Exception:
-            logger.error(f"读取配置文件失败: {traceback.format_exc()}")
-            self.excluded_plugins = []
+            logger.exception("读取配置文件失败")
+            self.excluded_plugins = frozenset()
 
     def set_client(self, client: "GeweClient") -> None:
         """设置客户端实例
@@ -85,44 +230,86 @@ class PluginManager(metaclass=Singleton):
             return await self._load_plugin_class(plugin)
         return False
 
+    def _maybe_reload(self, module, main_file: str):
+        """仅在插件源文件发生变化时重新加载模块
+
+        无条件的importlib.reload会重复执行模块体并泄漏旧类，
+        而绝大多数情况下文件并未改动。通过比较main.py的mtime，
+        只有检测到变化时才执行reload；首次导入只记录mtime。
+
+        Args:
+            module: 已导入的插件模块
+            main_file: 插件main.py的文件路径
+
+        Returns:
+            模块对象（发生reload时为重新加载后的模块）
+        """
+        try:
+            mt = os.stat(main_file).st_mtime_ns
+        except OSError:
+            # 无法获取mtime时退回到无条件reload
+            return importlib.reload(module)
+
+        last = _module_mtimes.get(module.__name__)
+        if last is not None and last != mt:
+            module = importlib.reload(module)
+        _module_mtimes[module.__name__] = mt
+        return module
+
+    def _add_sys_path(self, path: str) -> None:
+        """将目录加入sys.path（若尚未加入）
+
+        使用模块级的集合缓存做成员检查，避免每次线性扫描sys.path。
+
+        Args:
+            path: 要加入搜索路径的目录
+        """
+        if path in _inserted_paths:
+            return
+        if path not in sys.path:
+            sys.path.insert(0, path)
+        _inserted_paths.add(path)
+
     def _ensure_plugin_paths(self) -> None:
         """确保插件路径已正确设置
 
         将plugins目录和plugins/utils目录添加到Python的模块搜索路径中，
-        使插件可以通过'utils'模块名称直接导入桥接层
+        使插件可以通过'utils'模块名称直接导入桥接层。
+        路径设置完成后会被标记为就绪，后续调用直接返回。
         """
+        if self._paths_ready:
+            return
+
         # 确保plugins目录存在
+        # 直接依赖exist_ok=True，免去先exists再创建的多余syscall和竞态
         plugins_dir = os.path.abspath("plugins")
-        if not os.path.exists(plugins_dir):
+        try:
+            os.makedirs(plugins_dir, exist_ok=True)
+            # 创建__init__.py文件以使其成为有效的Python包
+            # "x"模式原子地处理文件已存在的情况
+            init_file = os.path.join(plugins_dir, "__init__.py")
             try:
-                os.makedirs(plugins_dir, exist_ok=True)
-                logger.info(f"插件目录不存在，已创建: {plugins_dir}")
-                # 创建__init__.py文件以使其成为有效的Python包
-                init_file = os.path.join(plugins_dir, "__init__.py")
-                if not os.path.exists(init_file):
-                    with open(init_file, "w") as f:
-                        f.write("# 插件目录\n")
-                    logger.info(f"创建了插件包初始化文件: {init_file}")
-            except Exception as e:
-                logger.error(f"创建插件目录失败: {e}")
-                logger.warning("将使用内存中的插件，不会加载文件系统中的插件")
+                with open(init_file, "x") as f:
+                    f.write("# 插件目录\n")
+                logger.info(f"创建了插件包初始化文件: {init_file}")
+            except FileExistsError:
+                pass
+        except Exception as e:
+            logger.error(f"创建插件目录失败: {e}")
+            logger.warning("将使用内存中的插件，不会加载文件系统中的插件")
 
         # 确保plugins目录在搜索路径中
-        if plugins_dir not in sys.path:
-            sys.path.insert(0, plugins_dir)
+        self._add_sys_path(plugins_dir)
 
         # 确保plugins的父目录也在搜索路径中
         # 这样插件可以通过相对导入找到utils包
-        parent_dir = os.path.dirname(plugins_dir)
-        if parent_dir not in sys.path:
-            sys.path.insert(0, parent_dir)
+        self._add_sys_path(os.path.dirname(plugins_dir))
 
         # 确保当前目录在搜索路径中，有些插件可能使用相对导入
-        current_dir = os.getcwd()
-        if current_dir not in sys.path:
-            sys.path.insert(0, current_dir)
+        self._add_sys_path(os.getcwd())
 
         logger.debug(f"已设置插件搜索路径: {sys.path[:5]}...")
+        self._paths_ready = True
 
     async def _load_plugin_class(
         self, plugin_class: Type[PluginBase], is_disabled: bool = False
@@ -141,73 +328,91 @@ class PluginManager(metaclass=Singleton):
             1. 当插件在外部配置中被禁用（is_disabled=True）
             2. 当插件自身的配置中设置了enable=False
         """
-        try:
-            plugin_name = plugin_class.__name__
+        plugin_name = plugin_class.__name__
 
-            # 防止重复加载插件
-            if plugin_name in self.plugins:
+        # 在锁内同时检查已加载和加载中的插件名并预留名额，
+        # 确保后续的实例化/启用等待点不会让同名插件的并发加载通过检查
+        async with self._state_lock:
+            if plugin_name in self.plugins or plugin_name in self._loading:
                 return False
+            self._loading.add(plugin_name)
 
-            # 安全获取插件目录名
-            directory = "unknown"
+        try:
+            # 安全获取插件目录名（结果按模块名缓存）
             try:
-                module_name = plugin_class.__module__
-                if module_name.startswith("plugins."):
-                    directory = module_name.split(".")[1]
-                else:
-                    logger.warning(f"非常规插件模块路径: {module_name}")
+                directory = _module_to_directory(plugin_class.__module__)
             except Exception as e:
                 logger.error(f"获取插件目录失败: {e}")
                 directory = "error"
 
-            # 记录插件信息，即使插件被禁用也会记录
-            self.plugin_info[plugin_name] = {
-                "name": plugin_name,
-                "description": plugin_class.description,
-                "author": plugin_class.author,
-                "version": plugin_class.version,
-                "directory": directory,
-                "enabled": False,
-                "class": plugin_class,
-            }
+            async with self._state_lock:
+                # 记录插件信息，即使插件被禁用也会记录
+                self.plugin_info[plugin_name] = {
+                    "name": plugin_name,
+                    "description": plugin_class.description,
+                    "author": plugin_class.author,
+                    "version": plugin_class.version,
+                    "directory": directory,
+                    "enabled": False,
+                    "class": plugin_class,
+                }
+                # 记录名称索引，供按名称加载时直接定位模块
+                self._name_to_module[plugin_name] = plugin_class.__module__
+                self._plugin_info_cache = None
+
+            # 被外部配置禁用时直接跳过，不执行插件的__init__
+            # （插件构造函数可能打开文件、连接服务等，代价不小）
+            if is_disabled:
+                logger.info(f"插件 {plugin_name} 被配置文件禁用, 跳过加载")
+                return False
+
+            # 类级别的enable默认值为False时同样无需实例化
+            if getattr(plugin_class, "enable", True) is False:
+                logger.info(f"插件 {plugin_name} 在插件配置中被禁用, 跳过加载")
+                return False
 
             # 创建插件实例，以检查其自身配置
             try:
                 plugin = plugin_class()
 
-                # 检查插件自身是否在配置中设置为禁用
+                # 检查插件实例是否在配置中设置为禁用
                 plugin_self_disabled = hasattr(plugin, "enable") and not plugin.enable
             except Exception as e:
-                logger.error(f"初始化插件 {plugin_name} 实例时出错: {e}")
-                logger.error(traceback.format_exc())
+                logger.exception(f"初始化插件 {plugin_name} 实例时出错: {e}")
                 return False
 
-            # 如果插件被外部禁用或自身配置为禁用，则跳过加载
-            if is_disabled or plugin_self_disabled:
-                logger.info(
-                    f"插件 {plugin_name} {'被配置文件禁用' if is_disabled else '在插件配置中被禁用'}, 跳过加载"
-                )
+            # 插件自身配置为禁用时跳过加载
+            if plugin_self_disabled:
+                logger.info(f"插件 {plugin_name} 在插件配置中被禁用, 跳过加载")
                 return False
 
             # 绑定事件处理方法
             EventManager.bind_instance(plugin)
-            # 启用插件
-            await plugin.on_enable(self.client)
-            # 执行异步初始化
-            await plugin.async_init()
+            # 启用插件并执行异步初始化
+            # 声明parallel_init = True的插件两步并发执行，适用于
+            # async_init不依赖on_enable执行结果的I/O密集型初始化
+            if getattr(plugin_class, "parallel_init", False):
+                await asyncio.gather(
+                    plugin.on_enable(self.client), plugin.async_init()
+                )
+            else:
+                await plugin.on_enable(self.client)
+                await plugin.async_init()
 
             # 记录插件实例和类
-            self.plugins[plugin_name] = plugin
-            self.plugin_classes[plugin_name] = plugin_class
-            self.plugin_info[plugin_name]["enabled"] = True
+            async with self._state_lock:
+                self.plugins[plugin_name] = plugin
+                self.plugin_classes[plugin_name] = plugin_class
+                self.plugin_info[plugin_name]["enabled"] = True
+                self._plugin_info_cache = None
 
             logger.info(f"加载插件 {plugin_name} 成功")
             return True
         except Exception:
-            logger.error(
-                f"加载插件 {plugin_name} 时发生错误:\n{traceback.format_exc()}"
-            )
+            logger.exception(f"加载插件 {plugin_name} 时发生错误")
             return False
+        finally:
+            self._loading.discard(plugin_name)
 
     async def _load_plugin_name(self, plugin_name: str) -> bool:
         """通过名称加载单个插件
@@ -220,35 +425,52 @@ class PluginManager(metaclass=Singleton):
         """
         found = False
 
+        # 优先使用名称索引，命中时只需一次导入而非扫描全部插件目录
+        indexed_module = self._name_to_module.get(plugin_name)
+        if indexed_module is not None:
+            try:
+                module = _cached_import(indexed_module)
+                module_file = getattr(module, "__file__", None)
+                if module_file:
+                    module = self._maybe_reload(module, module_file)
+                obj = getattr(module, plugin_name, None)
+                if (
+                    isinstance(obj, type)
+                    and issubclass(obj, PluginBase)
+                    and obj is not PluginBase
+                ):
+                    return await self._load_plugin_class(obj)
+                # 索引已失效（插件被移除或改名），回退到目录扫描
+                self._name_to_module.pop(plugin_name, None)
+            except Exception:
+                logger.exception(f"通过索引加载插件 {plugin_name} 失败")
+                self._name_to_module.pop(plugin_name, None)
+
         try:
             plugins_dir = os.path.abspath("plugins")
             if not os.path.exists(plugins_dir):
                 logger.warning(f"插件目录不存在: {plugins_dir}")
                 return False
 
-            for dirname in os.listdir(plugins_dir):
-                try:
-                    plugin_path = os.path.join(plugins_dir, dirname)
-                    main_file = os.path.join(plugin_path, "main.py")
-
-                    if os.path.isdir(plugin_path) and os.path.exists(main_file):
-                        module = importlib.import_module(f"plugins.{dirname}.main")
-                        importlib.reload(module)
-
-                        for name, obj in inspect.getmembers(module):
-                            if (
-                                inspect.isclass(obj)
-                                and issubclass(obj, PluginBase)
-                                and obj != PluginBase
-                                and obj.__name__ == plugin_name
-                            ):
+            with os.scandir(plugins_dir) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        main_file = os.path.join(entry.path, "main.py")
+                        if not os.path.isfile(main_file):
+                            continue
+
+                        module = _cached_import(f"plugins.{entry.name}.main")
+                        module = self._maybe_reload(module, main_file)
+
+                        for obj in _iter_plugin_classes(module):
+                            if obj.__name__ == plugin_name:
                                 found = True
                                 return await self._load_plugin_class(obj)
-                except Exception:
-                    logger.error(
-                        f"检查 {dirname} 时发生错误:\n{traceback.format_exc()}"
-                    )
-                    continue
+                    except Exception:
+                        logger.exception(f"检查 {entry.name} 时发生错误")
+                        continue
         except FileNotFoundError:
             logger.warning(f"插件目录不存在: {plugins_dir}")
             return False
@@ -256,9 +478,7 @@ class PluginManager(metaclass=Singleton):
             logger.warning(f"无权限访问插件目录: {plugins_dir}")
             return False
         except Exception as e:
-            logger.error(
-                f"加载插件 {plugin_name} 时发生未知错误: {e}\n{traceback.format_exc()}"
-            )
+            logger.exception(f"加载插件 {plugin_name} 时发生未知错误: {e}")
             return False
 
         if not found:
@@ -266,6 +486,57 @@ class PluginManager(metaclass=Singleton):
             return False
         return False
 
+    def _discover_sync(
+        self, directory: str, load_disabled: bool, prefix: str = "plugins"
+    ) -> List[Tuple[Type[PluginBase], bool]]:
+        """同步扫描目录并导入插件模块，返回(插件类, 是否被禁用)列表
+
+        扫描、导入和按需reload均为阻塞操作，调用方应通过
+        asyncio.to_thread在线程中执行本方法，保持事件循环响应。
+
+        Args:
+            directory: 插件目录路径
+            load_disabled: 是否加载被禁用的插件
+            prefix: 模块前缀，为空时直接以目录名作为顶层包名
+
+        Returns:
+            List[Tuple[Type[PluginBase], bool]]: 发现的插件类及其禁用状态
+        """
+        discovered: List[Tuple[Type[PluginBase], bool]] = []
+        # 热循环中反复访问的属性提前绑定为局部变量
+        excluded = self.excluded_plugins
+        path_join = os.path.join
+        # 使用scandir复用readdir返回的类型信息，避免逐项stat
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                main_file = path_join(entry.path, "main.py")
+                if not os.path.isfile(main_file):
+                    continue
+
+                try:
+                    if prefix:
+                        module_name = f"{prefix}.{entry.name}.main"
+                    else:
+                        module_name = f"{entry.name}.main"
+
+                    module = _cached_import(module_name)
+                    # 仅在源文件变化时重新加载模块，确保获取最新的代码
+                    module = self._maybe_reload(module, main_file)
+
+                    for obj in _iter_plugin_classes(module):
+                        is_disabled = False
+                        if not load_disabled:
+                            is_disabled = (
+                                obj.__name__ in excluded
+                                or entry.name in excluded
+                            )
+                        discovered.append((obj, is_disabled))
+                except Exception:
+                    logger.exception(f"加载 {entry.name} 时发生错误")
+        return discovered
+
     async def load_plugins(self, load_disabled: bool = False) -> List[str]:
         """加载所有插件
 
@@ -292,43 +563,31 @@ class PluginManager(metaclass=Singleton):
                 logger.warning(f"无法读取插件目录: {plugins_dir}")
                 return loaded_plugins
 
-            for dirname in os.listdir(plugins_dir):
-                plugin_path = os.path.join(plugins_dir, dirname)
-                main_file = os.path.join(plugin_path, "main.py")
+            # 目录扫描和模块导入是阻塞操作，放到线程中执行，
+            # 避免重插件的模块体执行卡住事件循环
+            discovered = await asyncio.to_thread(
+                self._discover_sync, plugins_dir, load_disabled
+            )
 
-                if os.path.isdir(plugin_path) and os.path.exists(main_file):
-                    try:
-                        module = importlib.import_module(f"plugins.{dirname}.main")
-                        # 重新加载模块，确保获取最新的代码
-                        importlib.reload(module)
-
-                        for name, obj in inspect.getmembers(module):
-                            if (
-                                inspect.isclass(obj)
-                                and issubclass(obj, PluginBase)
-                                and obj != PluginBase
-                            ):
-                                is_disabled = False
-                                if not load_disabled:
-                                    is_disabled = (
-                                        obj.__name__ in self.excluded_plugins
-                                        or dirname in self.excluded_plugins
-                                    )
-
-                                if await self._load_plugin_class(
-                                    obj, is_disabled=is_disabled
-                                ):
-                                    loaded_plugins.append(obj.__name__)
-                    except Exception:
-                        logger.error(
-                            f"加载 {dirname} 时发生错误:\n{traceback.format_exc()}"
-                        )
+            # 并发启用已发现的插件类，单个插件的异常不会影响其他插件
+            results = await asyncio.gather(
+                *(
+                    self._load_plugin_class(obj, is_disabled=is_disabled)
+                    for obj, is_disabled in discovered
+                ),
+                return_exceptions=True,
+            )
+            for (obj, _), result in zip(discovered, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"加载插件 {obj.__name__} 任务异常: {result}")
+                elif result:
+                    loaded_plugins.append(obj.__name__)
         except FileNotFoundError:
             logger.warning(f"插件目录不存在: {plugins_dir}")
         except PermissionError:
             logger.warning(f"无权限访问插件目录: {plugins_dir}")
         except Exception as e:
-            logger.error(f"加载插件时发生未知错误: {e}\n{traceback.format_exc()}")
+            logger.exception(f"加载插件时发生未知错误: {e}")
 
         return loaded_plugins
 
@@ -357,18 +616,18 @@ class PluginManager(metaclass=Singleton):
             # 解绑事件处理方法
             EventManager.unbind_instance(plugin)
 
-            # 从记录中删除插件
-            del self.plugins[plugin_name]
-            # 保留插件类，以便重新加载
-            if plugin_name in self.plugin_info:
-                self.plugin_info[plugin_name]["enabled"] = False
+            # 从记录中删除插件（并发卸载时通过锁保护共享状态）
+            async with self._state_lock:
+                self.plugins.pop(plugin_name, None)
+                # 保留插件类，以便重新加载
+                if plugin_name in self.plugin_info:
+                    self.plugin_info[plugin_name]["enabled"] = False
+                self._plugin_info_cache = None
 
             logger.info(f"卸载插件 {plugin_name} 成功")
             return True
         except Exception:
-            logger.error(
-                f"卸载插件 {plugin_name} 时发生错误:\n{traceback.format_exc()}"
-            )
+            logger.exception(f"卸载插件 {plugin_name} 时发生错误")
             return False
 
     async def unload_plugins(self) -> Tuple[List[str], List[str]]:
@@ -377,11 +636,20 @@ class PluginManager(metaclass=Singleton):
         Returns:
             Tuple[List[str], List[str]]: 成功卸载的插件名称列表和失败的插件名称列表
         """
+        # 并发卸载所有插件，on_disable中的I/O清理可以重叠执行
+        names = list(self.plugins.keys())
+        results = await asyncio.gather(
+            *(self.unload_plugin(name) for name in names),
+            return_exceptions=True,
+        )
+
         unloaded_plugins = []
         failed_unloads = []
-
-        for plugin_name in list(self.plugins.keys()):
-            if await self.unload_plugin(plugin_name):
+        for plugin_name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"卸载插件 {plugin_name} 任务异常: {result}")
+                failed_unloads.append(plugin_name)
+            elif result:
                 unloaded_plugins.append(plugin_name)
             else:
                 failed_unloads.append(plugin_name)
@@ -415,33 +683,32 @@ class PluginManager(metaclass=Singleton):
             if not await self.unload_plugin(plugin_name):
                 return False
 
-            # 重新导入模块
+            # 重新导入模块（显式重载请求，跳过mtime判断）
             try:
-                module = importlib.import_module(module_name)
-                importlib.reload(module)
+                module = _cached_import(module_name)
+                module = importlib.reload(module)
+                module_file = getattr(module, "__file__", None)
+                if module_file:
+                    try:
+                        _module_mtimes[module.__name__] = os.stat(
+                            module_file
+                        ).st_mtime_ns
+                    except OSError:
+                        pass
             except Exception:
-                logger.error(
-                    f"重新导入模块 {module_name} 失败: {traceback.format_exc()}"
-                )
+                logger.exception(f"重新导入模块 {module_name} 失败")
                 return False
 
             # 从重新加载的模块中获取插件类
-            for name, obj in inspect.getmembers(module):
-                if (
-                    inspect.isclass(obj)
-                    and issubclass(obj, PluginBase)
-                    and obj != PluginBase
-                    and obj.__name__ == plugin_name
-                ):
+            for obj in _iter_plugin_classes(module):
+                if obj.__name__ == plugin_name:
                     # 使用新的插件类重新加载
                     return await self._load_plugin_class(obj)
 
             logger.error(f"在重新加载的模块 {module_name} 中未找到插件类 {plugin_name}")
             return False
         except Exception:
-            logger.error(
-                f"重载插件 {plugin_name} 时发生错误:\n{traceback.format_exc()}"
-            )
+            logger.exception(f"重载插件 {plugin_name} 时发生错误")
             return False
 
     async def reload_plugins(self) -> List[str]:
@@ -463,34 +730,48 @@ class PluginManager(metaclass=Singleton):
                 await self.unload_plugin(plugin_name)
 
             # 清除所有插件模块的缓存
-            for module_name in list(sys.modules.keys()):
-                if module_name.startswith("plugins.") and not module_name.endswith(
-                    "ManagePlugin"
-                ):
-                    try:
-                        del sys.modules[module_name]
-                    except KeyError:
-                        pass
-
-            # 重新加载原来的插件
-            for plugin_name in original_plugins:
-                if await self.load_plugin(plugin_name):
+            victims = [
+                name
+                for name in sys.modules
+                if name.startswith(_PLUGIN_PREFIX)
+                and not name.endswith("ManagePlugin")
+            ]
+            for name in victims:
+                sys.modules.pop(name, None)
+                _module_mtimes.pop(name, None)
+
+            # 并发重新加载原来的插件
+            results = await asyncio.gather(
+                *(self.load_plugin(name) for name in original_plugins),
+                return_exceptions=True,
+            )
+            for plugin_name, result in zip(original_plugins, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"重新加载插件 {plugin_name} 异常: {result}")
+                elif result:
                     reloaded_plugins.append(plugin_name)
 
             return reloaded_plugins
         except Exception:
-            logger.error(f"重载插件时发生错误:\n{traceback.format_exc()}")
+            logger.exception("重载插件时发生错误")
             return reloaded_plugins
 
-    async def refresh_plugins(self) -> Tuple[List[str], List[str]]:
+    async def refresh_plugins(
+        self, rescan_paths: bool = False
+    ) -> Tuple[List[str], List[str]]:
         """刷新插件
 
         卸载所有插件，然后从文件系统重新加载所有插件。
 
+        Args:
+            rescan_paths: 是否强制重新检查并设置插件搜索路径
+
         Returns:
             Tuple[List[str], List[str]]: 成功加载的插件名称列表和卸载但未能重新加载的插件名称列表
         """
         # 确保插件路径已正确设置
+        if rescan_paths:
+            self._paths_ready = False
         self._ensure_plugin_paths()
 
         # 记录当前加载的插件
@@ -500,12 +781,10 @@ class PluginManager(metaclass=Singleton):
         unloaded, _ = await self.unload_plugins()
 
         # 清除模块缓存
-        for module_name in list(sys.modules.keys()):
-            if module_name.startswith("plugins."):
-                try:
-                    del sys.modules[module_name]
-                except KeyError:
-                    pass
+        victims = [name for name in sys.modules if name.startswith(_PLUGIN_PREFIX)]
+        for name in victims:
+            sys.modules.pop(name, None)
+            _module_mtimes.pop(name, None)
 
         # 重新加载所有插件
         loaded_plugins = await self.load_plugins()
@@ -517,20 +796,22 @@ class PluginManager(metaclass=Singleton):
 
     def get_plugin_info(
         self, plugin_name: Optional[str] = None
-    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    ) -> Union[Dict[str, Any], Tuple[Dict[str, Any], ...]]:
         """获取插件信息
 
         Args:
             plugin_name: 插件名称，如果为None则返回所有插件的信息
 
         Returns:
-            Union[Dict[str, Any], List[Dict[str, Any]]]: 插件信息或所有插件的信息列表
+            Union[Dict[str, Any], Tuple[Dict[str, Any], ...]]: 插件信息或所有插件的信息序列
         """
         if plugin_name is not None:
             return self.plugin_info.get(plugin_name, {})
 
-        # 返回所有插件信息的列表
-        return list(self.plugin_info.values())
+        # 返回所有插件信息的缓存元组，插件加载/卸载时才重新物化
+        if self._plugin_info_cache is None:
+            self._plugin_info_cache = tuple(self.plugin_info.values())
+        return self._plugin_info_cache
 
     async def register_plugin(self, plugin: Union[Type[PluginBase], str]) -> bool:
         """注册插件（加载插件的别名）
@@ -572,45 +853,30 @@ class PluginManager(metaclass=Singleton):
                 return loaded_plugins
 
             # 确保指定目录在搜索路径中
-            abs_directory = os.path.abspath(directory)
-            if abs_directory not in sys.path:
-                sys.path.insert(0, abs_directory)
+            self._add_sys_path(os.path.abspath(directory))
 
-            for dirname in os.listdir(directory):
-                plugin_path = os.path.join(directory, dirname)
-                main_file = os.path.join(plugin_path, "main.py")
+            # 阻塞的扫描与导入放到线程中执行；该入口不套用禁用列表，
+            # 因此以load_disabled=True调用发现逻辑
+            discovered = await asyncio.to_thread(
+                self._discover_sync, directory, True, prefix
+            )
 
-                if os.path.isdir(plugin_path) and os.path.exists(main_file):
-                    try:
-                        # 构建模块名
-                        if prefix:
-                            module_name = f"{prefix}.{dirname}.main"
-                        else:
-                            module_name = f"{dirname}.main"
-
-                        module = importlib.import_module(module_name)
-                        importlib.reload(module)
-
-                        for name, obj in inspect.getmembers(module):
-                            if (
-                                inspect.isclass(obj)
-                                and issubclass(obj, PluginBase)
-                                and obj != PluginBase
-                            ):
-                                if await self._load_plugin_class(obj):
-                                    loaded_plugins.append(obj.__name__)
-                    except Exception:
-                        logger.error(
-                            f"从 {directory} 加载 {dirname} 时发生错误:\n{traceback.format_exc()}"
-                        )
+            # 并发启用已发现的插件类，单个插件的异常不会影响其他插件
+            results = await asyncio.gather(
+                *(self._load_plugin_class(obj) for obj, _ in discovered),
+                return_exceptions=True,
+            )
+            for (obj, _), result in zip(discovered, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"加载插件 {obj.__name__} 任务异常: {result}")
+                elif result:
+                    loaded_plugins.append(obj.__name__)
         except FileNotFoundError:
             logger.warning(f"指定的插件目录不存在: {directory}")
         except PermissionError:
             logger.warning(f"无权限访问指定的插件目录: {directory}")
         except Exception as e:
-            logger.error(
-                f"从 {directory} 加载插件时发生未知错误: {e}\n{traceback.format_exc()}"
-            )
+            logger.exception(f"从 {directory} 加载插件时发生未知错误: {e}")
 
         return loaded_plugins
 
@@ -626,5 +892,9 @@ class PluginManager(metaclass=Singleton):
             logger.warning("未设置客户端实例，无法处理消息")
             return
 
+        # 无插件订阅该消息类型时直接返回，省去emit内部的协程与拷贝开销
+        if not EventManager.has_handlers(message.type):
+            return
+
         # 使用EventManager发送消息事件
         await EventManager.emit(message.type, self.client, message)